@@ -7,11 +7,245 @@ Created on 22/10/2022.
 Streamlit app to calculate the resulting TTR-Score after a tournament.
 """
 
+import io
+import os
+
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import matplotlib.pyplot as plt
 
 
+_what_if_component = components.declare_component(
+    "what_if",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      "frontend", "what_if"))
+
+
+class _MatchNode:
+    """One match of a tournament, linked to the previously played match."""
+
+    __slots__ = ("ttr_score_opponent", "victory", "previous",
+                 "number_of_matches", "match_results", "hash")
+
+    def __init__(
+            self,
+            ttr_score_opponent: int,
+            victory: bool,
+            previous: "_MatchNode" = None
+            ) -> None:
+        self.ttr_score_opponent = ttr_score_opponent
+        self.victory = victory
+        self.previous = previous
+        if previous is None:
+            self.number_of_matches = 1
+            self.match_results = int(victory)
+            self.hash = hash((ttr_score_opponent, victory))
+        else:
+            self.number_of_matches = previous.number_of_matches + 1
+            self.match_results = previous.match_results + int(victory)
+            self.hash = hash((previous.hash, ttr_score_opponent, victory))
+
+
+class Tournament:
+    """
+    Immutable tournament consisting of all played singles.
+
+    The matches are stored as a linked list of slotted nodes, so adding or
+    removing the last match is O(1) and returns a new tournament that shares
+    all other matches with this one. Every tournament is therefore a cheap
+    snapshot, that can be kept for undo / redo. The hash is updated with every
+    match, so a tournament can be used in dicts and sets. For caches shared
+    between sessions, the collision free key is used instead.
+    """
+
+    __slots__ = ("_last",)
+
+    def __init__(self) -> None:
+        self._last = None
+
+    @classmethod
+    def _from_node(
+            cls,
+            last: _MatchNode
+            ) -> "Tournament":
+        """Create a tournament ending with the given match."""
+        tournament = cls()
+        tournament._last = last
+        return tournament
+
+    def add_match(
+            self,
+            ttr_score_opponent: int,
+            victory: bool = True
+            ) -> "Tournament":
+        """
+        Return a new tournament with one additional match.
+
+        Parameters
+        ----------
+        ttr_score_opponent : int
+            The TTR-score of the opponent.
+        victory : bool, optional
+            Flag, whether the match was won. The default is True.
+
+        Returns
+        -------
+        Tournament
+            The tournament including the new match.
+        """
+        return Tournament._from_node(
+            _MatchNode(ttr_score_opponent, victory, self._last))
+
+    def remove_match(self) -> "Tournament":
+        """
+        Return a new tournament without the last match.
+
+        Returns
+        -------
+        Tournament
+            The tournament without the last match.
+        """
+        if self._last is None:
+            return self
+        return Tournament._from_node(self._last.previous)
+
+    def replace_match(
+            self,
+            match_id: int,
+            ttr_score_opponent: int,
+            victory: bool
+            ) -> "Tournament":
+        """
+        Return a new tournament with one match replaced.
+
+        Only the matches after the replaced one are rebuilt.
+
+        Parameters
+        ----------
+        match_id : int
+            The ID of the replaced match in the tournament.
+        ttr_score_opponent : int
+            The new TTR-score of the opponent.
+        victory : bool
+            Flag, whether the match was won.
+
+        Returns
+        -------
+        Tournament
+            The tournament including the replaced match.
+        """
+        following_matches = []
+        node = self._last
+        for _ in range(len(self) - match_id - 1):
+            following_matches.append(node)
+            node = node.previous
+
+        tournament = Tournament._from_node(node.previous).add_match(
+            ttr_score_opponent, victory)
+        for node in reversed(following_matches):
+            tournament = tournament.add_match(node.ttr_score_opponent,
+                                              node.victory)
+        return tournament
+
+    @property
+    def matches(self) -> list[tuple[int, bool]]:
+        """The TTR-score of the opponent and the result of every match."""
+        matches = []
+        node = self._last
+        while node is not None:
+            matches.append((node.ttr_score_opponent, node.victory))
+            node = node.previous
+        matches.reverse()
+        return matches
+
+    @property
+    def key(self) -> tuple[tuple[int, bool], ...]:
+        """Hashable key of the tournament, that is used for caching."""
+        return tuple(self.matches)
+
+    @property
+    def ttr_score_opponent_list(self) -> list[int]:
+        """The TTR-scores of all opponents."""
+        return [ttr_score_opponent for ttr_score_opponent, _ in self.matches]
+
+    @property
+    def match_results(self) -> int:
+        """The number of matches won in the tournament."""
+        return 0 if self._last is None else self._last.match_results
+
+    def __len__(self) -> int:
+        """Return the number of matches in the tournament."""
+        return 0 if self._last is None else self._last.number_of_matches
+
+    def __hash__(self) -> int:
+        """Return the hash of all matches in the tournament."""
+        return hash(()) if self._last is None else self._last.hash
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two tournaments by their matches."""
+        if not isinstance(other, Tournament):
+            return NotImplemented
+        if self._last is other._last:
+            return True
+        return len(self) == len(other) and hash(self) == hash(other) \
+            and self.matches == other.matches
+
+
+class TournamentHistory:
+    """Undo / redo history of tournament snapshots."""
+
+    __slots__ = ("current", "_undo_stack", "_redo_stack")
+
+    def __init__(
+            self,
+            tournament: Tournament
+            ) -> None:
+        self.current = tournament
+        self._undo_stack = []
+        self._redo_stack = []
+
+    def commit(
+            self,
+            tournament: Tournament
+            ) -> None:
+        """
+        Make the given tournament the current one.
+
+        Parameters
+        ----------
+        tournament : Tournament
+            The new tournament snapshot.
+        """
+        if tournament == self.current:
+            return
+        self._undo_stack.append(self.current)
+        self._redo_stack.clear()
+        self.current = tournament
+
+    def undo(self) -> None:
+        """Restore the previous tournament snapshot."""
+        if self._undo_stack:
+            self._redo_stack.append(self.current)
+            self.current = self._undo_stack.pop()
+
+    def redo(self) -> None:
+        """Restore the last undone tournament snapshot."""
+        if self._redo_stack:
+            self._undo_stack.append(self.current)
+            self.current = self._redo_stack.pop()
+
+    @property
+    def can_undo(self) -> bool:
+        """Flag, whether there is a snapshot to undo."""
+        return bool(self._undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        """Flag, whether there is a snapshot to redo."""
+        return bool(self._redo_stack)
+
+
 def main() -> None:
     """Run the streamlit app."""
     initialize_session()
@@ -25,8 +259,6 @@ def main() -> None:
 
 def initialize_session() -> None:
     """Initialize the streamlit session."""
-    if "number_of_matches" not in st.session_state:
-        st.session_state["number_of_matches"] = 1
     if "change_constant" not in st.session_state:
         st.session_state["change_constant"] = 16
     if "show_grid" not in st.session_state:
@@ -37,12 +269,9 @@ def initialize_session() -> None:
         st.session_state["use_darkmode"] = False
     if "current_ttr_score" not in st.session_state:
         st.session_state["current_ttr_score"] = None
-    if "ttr_score_opponent_list" not in st.session_state:
-        st.session_state["ttr_score_opponent_list"] = []
-    if "result_list" not in st.session_state:
-        st.session_state["result_list"] = []
-    if "match_results" not in st.session_state:
-        st.session_state["match_results"] = 0
+    if "tournament_history" not in st.session_state:
+        st.session_state["tournament_history"] = \
+            TournamentHistory(Tournament().add_match(1400, True))
     if "new_ttr_score" not in st.session_state:
         st.session_state["new_ttr_score"] = None
 
@@ -91,8 +320,10 @@ def section_calculator_tab(
         expander_additional_info_for_ttr_calculation()
         section_tournament()
         buttons_add_remove_match()
+        buttons_undo_redo()
         section_results()
         expander_detailed_match_summary()
+        expander_what_if_analysis()
 
 
 def section_current_ttr_points() -> None:
@@ -176,25 +407,58 @@ def calculate_change_constant(
     return change_constant
 
 
+def get_tournament() -> Tournament:
+    """
+    Get the current tournament of the session.
+
+    Returns
+    -------
+    Tournament
+        The current tournament snapshot.
+    """
+    return st.session_state["tournament_history"].current
+
+
+def commit_tournament(
+        tournament: Tournament
+        ) -> None:
+    """
+    Store a new tournament snapshot and update the match inputs accordingly.
+
+    Parameters
+    ----------
+    tournament : Tournament
+        The new tournament snapshot.
+    """
+    st.session_state["tournament_history"].commit(tournament)
+    sync_match_inputs()
+
+
+def sync_match_inputs() -> None:
+    """Set the values of all match inputs to the current tournament."""
+    for i, (ttr_score_opponent, victory) in \
+            enumerate(get_tournament().matches):
+        st.session_state[f"number_input_{i}"] = ttr_score_opponent
+        st.session_state[f"checkbox_{i}"] = victory
+
+
 def section_tournament() -> None:
     """Display the user input section for the tournament."""
-    st.session_state["ttr_score_opponent_list"] = []
-    st.session_state["result_list"] = []
-    st.session_state["match_results"] = 0
-
-    for i in range(st.session_state["number_of_matches"]):
-        section_one_match(i)
+    for i, (ttr_score_opponent, victory) in \
+            enumerate(get_tournament().matches):
+        section_one_match(i, ttr_score_opponent, victory)
 
     new_ttr_score = \
-        calculate_new_ttr_score(st.session_state["current_ttr_score"],
-                                st.session_state["ttr_score_opponent_list"],
-                                st.session_state["match_results"],
-                                st.session_state["number_of_matches"])
+        calculate_tournament_ttr_score(get_tournament().key,
+                                       st.session_state["current_ttr_score"],
+                                       st.session_state["change_constant"])
     st.session_state["new_ttr_score"] = new_ttr_score
 
 
 def section_one_match(
-        match_number: int = 0
+        match_number: int = 0,
+        ttr_score_opponent: int = 1400,
+        victory: bool = True
         ) -> None:
     """
     User input section for one match of the tournament.
@@ -203,31 +467,162 @@ def section_one_match(
     ----------
     match_number : int, optional
         The match ID in the tournament. The default is 0.
+    ttr_score_opponent : int, optional
+        The TTR-score of the opponent stored in the tournament.
+        The default is 1400.
+    victory : bool, optional
+        Flag, whether the match was won according to the tournament.
+        The default is True.
     """
+    # Streamlit drops the state of widgets, that were not displayed in the
+    # last run, so the values are restored from the tournament
+    if f"number_input_{match_number}" not in st.session_state:
+        st.session_state[f"number_input_{match_number}"] = ttr_score_opponent
+    if f"checkbox_{match_number}" not in st.session_state:
+        st.session_state[f"checkbox_{match_number}"] = victory
+
     st.write("***")
     st.subheader(f"Spiel {match_number+1}")
-    ttr_score_opponent = st.number_input("TTR-Punkte des Gegners",
-                                         min_value=0,
-                                         max_value=3000,
-                                         value=1400,
-                                         step=1,
-                                         key=f"number_input_{match_number}")
+    st.number_input("TTR-Punkte des Gegners",
+                    min_value=0,
+                    max_value=3000,
+                    step=1,
+                    key=f"number_input_{match_number}",
+                    on_change=update_match,
+                    args=(match_number,))
+
+    st.checkbox("Spiel gewonnen",
+                key=f"checkbox_{match_number}",
+                on_change=update_match,
+                args=(match_number,))
+
+
+def update_match(
+        match_number: int
+        ) -> None:
+    """
+    Store the user input of one match in the tournament.
+
+    Parameters
+    ----------
+    match_number : int
+        The match ID in the tournament.
+    """
+    commit_tournament(get_tournament().replace_match(
+        match_number,
+        st.session_state[f"number_input_{match_number}"],
+        st.session_state[f"checkbox_{match_number}"]))
 
-    victory = st.checkbox("Spiel gewonnen",
-                          value=True,
-                          key=f"checkbox_{match_number}")
 
-    st.session_state["ttr_score_opponent_list"].append(ttr_score_opponent)
-    st.session_state["result_list"].append(victory)
-    if victory:
-        st.session_state["match_results"] += 1
+@st.experimental_memo(max_entries=128)
+def calculate_tournament_ttr_score(
+        tournament_key: tuple[tuple[int, bool], ...],
+        current_ttr_score: int,
+        change_constant: int
+        ) -> int:
+    """
+    Calculate the new TTR-Score after the tournament.
+
+    The result is cached by streamlit, using the tournament key.
+
+    Parameters
+    ----------
+    tournament_key : tuple[tuple[int, bool], ...]
+        The key of the tournament with all played singles.
+    current_ttr_score : int
+        The current TTR-score of the player.
+    change_constant : int
+        The change constant used for the TTR-score calculation.
+
+    Returns
+    -------
+    new_ttr_score: int
+        The new TTR-score of the player after the tournament.
+    """
+    ttr_score_opponents = \
+        [ttr_score_opponent for ttr_score_opponent, _ in tournament_key]
+    match_results = sum(victory for _, victory in tournament_key)
+    return calculate_new_ttr_score(current_ttr_score,
+                                   ttr_score_opponents,
+                                   match_results,
+                                   change_constant)
+
+
+@st.experimental_memo(max_entries=128)
+def calculate_match_summaries(
+        tournament_key: tuple[tuple[int, bool], ...],
+        current_ttr_score: int,
+        change_constant: int
+        ) -> list[tuple[float, int]]:
+    """
+    Calculate the results of every single match of the tournament.
+
+    The result is cached by streamlit, using the tournament key.
+
+    Parameters
+    ----------
+    tournament_key : tuple[tuple[int, bool], ...]
+        The key of the tournament with all played singles.
+    current_ttr_score : int
+        The current TTR-score of the player.
+    change_constant : int
+        The change constant used for the TTR-score calculation.
+
+    Returns
+    -------
+    list[tuple[float, int]]
+        The winning probability and the new TTR-score, if only this match
+        would have been played, for every match.
+    """
+    summaries = []
+    for ttr_score_opponent, victory in tournament_key:
+        summaries.append(calculate_match_summary(ttr_score_opponent,
+                                                 victory,
+                                                 current_ttr_score,
+                                                 change_constant))
+    return summaries
+
+
+def calculate_match_summary(
+        ttr_score_opponent: int,
+        victory: bool,
+        current_ttr_score: int,
+        change_constant: int
+        ) -> tuple[float, int]:
+    """
+    Calculate the results of a single match.
+
+    Parameters
+    ----------
+    ttr_score_opponent : int
+        The TTR-score of the opponent in this match.
+    victory : bool
+        Flag, whether the match was won.
+    current_ttr_score : int
+        The current TTR-score of the player.
+    change_constant : int
+        The change constant used for the TTR-score calculation.
+
+    Returns
+    -------
+    tuple[float, int]
+        The winning probability and the new TTR-score, if only this match
+        would have been played.
+    """
+    winning_probability = calculate_winning_probability(current_ttr_score,
+                                                        ttr_score_opponent)
+    new_ttr_score = calculate_new_ttr_score(current_ttr_score,
+                                            [ttr_score_opponent],
+                                            int(victory),
+                                            change_constant)
+    return winning_probability, new_ttr_score
 
 
 def calculate_new_ttr_score(
         current_ttr_score: int,
-        ttr_score_opponent: list[int],
-        result: int = 1,
-        number_of_matches: int = 1
+        ttr_score_opponents: list[int],
+        result: int,
+        change_constant: int
         ) -> int:
     """
     Calculate the new TTR-Score based on all singles of a tournament.
@@ -236,34 +631,23 @@ def calculate_new_ttr_score(
     ----------
     current_ttr_score : int
         The current TTR-score of the player.
-    ttr_score_opponent : int | list[int]
-        The ttr_score(s) of the opponents.
-    result : int, optional
-        The number of matches won in the tournament. The default is 1.
-    number_of_matches : int, optional
-        The number of played matches in the tournament. The default is 1.
+    ttr_score_opponents : list[int]
+        The ttr_scores of the opponents.
+    result : int
+        The number of matches won in the tournament.
+    change_constant : int
+        The change constant used for the TTR-score calculation.
 
     Returns
     -------
     new_ttr_score: int
         The new TTR-score of the player after the tournament.
     """
-    change_constant = st.session_state["change_constant"]
     expected_result = 0
-
-    # Multiple matches were played
-    if isinstance(ttr_score_opponent, list):
-        for i in range(number_of_matches):
-            winning_propability = calculate_winning_probability(
-                ttr_score_player_a=current_ttr_score,
-                ttr_score_player_b=ttr_score_opponent[i])
-            expected_result += winning_propability
-    # Only a single match was played
-    else:
-        winning_propability = calculate_winning_probability(
+    for ttr_score_opponent in ttr_score_opponents:
+        expected_result += calculate_winning_probability(
             ttr_score_player_a=current_ttr_score,
             ttr_score_player_b=ttr_score_opponent)
-        expected_result += winning_propability
 
     new_ttr_score = current_ttr_score \
         + round((result-expected_result)*change_constant)
@@ -298,26 +682,54 @@ def buttons_add_remove_match() -> None:
     """Buttons to add / remove one match in the tournament."""
     col1, col2 = st.columns([1, 1])
     with col1:
-        disabled = st.session_state["number_of_matches"] >= 15
-        add_match = st.button("Weiteres Spiel hinzufügen",
-                              disabled=disabled)
+        st.button("Weiteres Spiel hinzufügen",
+                  disabled=len(get_tournament()) >= 15,
+                  on_click=add_match)
     with col2:
-        disabled = st.session_state["number_of_matches"] == 1
-        remove_match = st.button("Letztes Spiel entfernen",
-                                 disabled=disabled)
-
-    if add_match:
-        if st.session_state["number_of_matches"] < 15:
-            st.session_state["number_of_matches"] += 1
-        st.experimental_rerun()
-
-    if remove_match:
-        if st.session_state["number_of_matches"] > 1:
-            st.session_state["number_of_matches"] -= 1
-        st.experimental_rerun()
+        st.button("Letztes Spiel entfernen",
+                  disabled=len(get_tournament()) == 1,
+                  on_click=remove_match)
+
+
+def add_match() -> None:
+    """Add one match to the tournament."""
+    if len(get_tournament()) < 15:
+        commit_tournament(get_tournament().add_match(1400, True))
+
+
+def remove_match() -> None:
+    """Remove the last match from the tournament."""
+    if len(get_tournament()) > 1:
+        commit_tournament(get_tournament().remove_match())
+
+
+def buttons_undo_redo() -> None:
+    """Buttons to undo / redo the last change of the tournament."""
+    history = st.session_state["tournament_history"]
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.button("Rückgängig",
+                  disabled=not history.can_undo,
+                  on_click=undo_tournament_change)
+    with col2:
+        st.button("Wiederholen",
+                  disabled=not history.can_redo,
+                  on_click=redo_tournament_change)
     st.write("***")
 
 
+def undo_tournament_change() -> None:
+    """Restore the previous tournament snapshot."""
+    st.session_state["tournament_history"].undo()
+    sync_match_inputs()
+
+
+def redo_tournament_change() -> None:
+    """Restore the last undone tournament snapshot."""
+    st.session_state["tournament_history"].redo()
+    sync_match_inputs()
+
+
 def section_results() -> None:
     """Display the new TTR-score of the player."""
     st.header("Ergebnis :clipboard:")
@@ -330,53 +742,133 @@ def section_results() -> None:
 def expander_detailed_match_summary() -> None:
     """Display expander with additional details about the score calculation."""
     with st.expander("Detailierte Ergebnisse anzeigen"):
-        for i in range(st.session_state["number_of_matches"]):
-            result = 1 if st.session_state["result_list"][i] else 0
-            header = "gewonnen :first_place_medal:" if result == 1 \
+        tournament = get_tournament()
+        summaries = \
+            calculate_match_summaries(tournament.key,
+                                      st.session_state["current_ttr_score"],
+                                      st.session_state["change_constant"])
+        for i, (ttr_score_opponent, victory) in \
+                enumerate(tournament.matches):
+            winning_probability, new_ttr_score = summaries[i]
+            header = "gewonnen :first_place_medal:" if victory \
                 else "verloren"
             st.subheader(f"Spiel {i+1} - {header}")
-            section_match_ttr_table(i)
-
-            winning_probability = \
-                calculate_winning_probability(
-                    st.session_state["current_ttr_score"],
-                    st.session_state["ttr_score_opponent_list"][i])
+            section_match_ttr_table(ttr_score_opponent)
             section_winning_probability_bar(winning_probability)
-
-            new_ttr_score = \
-                calculate_new_ttr_score(
-                    st.session_state["current_ttr_score"],
-                    st.session_state["ttr_score_opponent_list"][i],
-                    result=result)
             section_new_ttr_score_after_single(new_ttr_score)
 
             if st.session_state["show_graphs"]:
-                section_graphs_after_single(winning_probability,
-                                            new_ttr_score,
-                                            match_id=i,
-                                            result=result)
+                section_graphs_after_single(ttr_score_opponent, victory)
             st.write("***")
 
 
+def expander_what_if_analysis() -> None:
+    """Display expander with the interactive what-if analysis of one match."""
+    with st.expander("Was wäre, wenn? :crystal_ball:"):
+        st.write("Verschiebe den Regler, um die Gewinnerwartung und die"
+                 " Veränderung der TTR-Punkte für einen anderen Gegner zu"
+                 " sehen. Die Berechnung erfolgt direkt im Browser.")
+        matches = get_tournament().matches
+        match_id = st.selectbox(
+            "Spiel",
+            options=list(range(len(matches))),
+            format_func=lambda i: f"Spiel {i+1}")
+        ttr_score_opponent, victory = matches[match_id]
+        result = 1 if victory else 0
+
+        # The opponent score is part of the key, so a previously applied
+        # value is dropped, once the match itself is changed
+        what_if_ttr_score_opponent = what_if_slider(
+            st.session_state["current_ttr_score"],
+            ttr_score_opponent,
+            result=result,
+            key=f"what_if_{match_id}_{ttr_score_opponent}")
+        section_what_if_result(what_if_ttr_score_opponent, result)
+
+
+def what_if_slider(
+        ttr_score: int,
+        ttr_score_opponent: int,
+        result: int = 1,
+        key: str = None
+        ) -> int:
+    """
+    Display the client-side what-if slider for one match.
+
+    The curves are evaluated in the browser while dragging the slider.
+    Only the opponent TTR-score confirmed by the user is sent back.
+
+    Parameters
+    ----------
+    ttr_score : int
+        The current TTR-score of the player.
+    ttr_score_opponent : int
+        The TTR-score of the opponent, used as initial slider value.
+    result : int, optional
+        Indicates, whether this match was won. 1 if match was won,
+        0 if match was lost. The default is 1.
+    key : str, optional
+        The streamlit key of the component. The default is None.
+
+    Returns
+    -------
+    int
+        The confirmed TTR-score of the opponent. Before the user confirmed
+        a value, the given ttr_score_opponent is returned.
+    """
+    return _what_if_component(
+        ttr_score=ttr_score,
+        ttr_score_opponent=ttr_score_opponent,
+        change_constant=st.session_state["change_constant"],
+        result=result,
+        show_grid=st.session_state["show_grid"],
+        use_darkmode=st.session_state["use_darkmode"],
+        key=key,
+        default=ttr_score_opponent)
+
+
+def section_what_if_result(
+        ttr_score_opponent: int,
+        result: int = 1
+        ) -> None:
+    """
+    Display the resulting TTR-score for the confirmed what-if value.
+
+    Parameters
+    ----------
+    ttr_score_opponent : int
+        The TTR-score of the opponent chosen in the what-if analysis.
+    result : int, optional
+        Indicates, whether this match was won. 1 if match was won,
+        0 if match was lost. The default is 1.
+    """
+    new_ttr_score = calculate_new_ttr_score(
+        st.session_state["current_ttr_score"],
+        [ttr_score_opponent],
+        result,
+        st.session_state["change_constant"])
+    st.metric(f"Neuer TTR-Score gegen {ttr_score_opponent} TTR-Punkte",
+              value=new_ttr_score,
+              delta=new_ttr_score - st.session_state["current_ttr_score"])
+
+
 def section_match_ttr_table(
-        match_id: int = 0
+        ttr_score_opponent: int
         ) -> None:
     """
     Display the TTR-difference as table for the given match.
 
     Parameters
     ----------
-    match_id : int, optional
-        The ID of the match. The default is 0.
+    ttr_score_opponent : int
+        The TTR-score of the opponent in this match.
     """
     table = pd.DataFrame({"Dein aktueller TTR-Score":
                          [st.session_state["current_ttr_score"]],
                          "TTR-Wert des Gegners":
-                          [st.session_state["ttr_score_opponent_list"]
-                           [match_id]],
+                          [ttr_score_opponent],
                           "TTR-Differenz":
-                          [st.session_state["ttr_score_opponent_list"]
-                           [match_id]
+                          [ttr_score_opponent
                            - st.session_state["current_ttr_score"]]})
 
     hide_table_row_index = """
@@ -424,7 +916,7 @@ def section_new_ttr_score_after_single(
     new_ttr_score : int
         The resulting new TTR-score if only this match was played.
     """
-    if st.session_state["number_of_matches"] > 1:
+    if len(get_tournament()) > 1:
         st.write("Wäre dies das einzige Spiel gewesen, wäre dein"
                  f" neuer TTR-Score: {new_ttr_score}"
                  f" ({new_ttr_score-st.session_state['current_ttr_score']:+}"
@@ -443,46 +935,112 @@ def section_new_ttr_score_after_single(
 
 
 def section_graphs_after_single(
-        winning_probability: int,
-        new_ttr_score: int,
-        match_id: int = 0,
-        result: int = 1
+        ttr_score_opponent: int,
+        victory: bool = True
         ) -> None:
     """
     Display graphs for the given match.
 
     Parameters
     ----------
-    winning_probability : int
-        The winning probability for this match.
-    new_ttr_score : int
-        The new TTR-score, if only this match would have been played.
-    match_id : int, optional
-        The ID of this match in the tournament. The default is 0.
-    result : int, optional
-        Indicates, whether this match was won. 1 if match was won,
-        0 if match was lost. The default is 1.
+    ttr_score_opponent : int
+        The TTR-score of the opponent in this match.
+    victory : bool, optional
+        Flag, whether the match was won. The default is True.
     """
-    if st.session_state["use_darkmode"]:
-        plt.style.use("dark_background")
-    else:
-        plt.style.use("default")
+    images = render_graphs_after_single(ttr_score_opponent,
+                                        victory,
+                                        st.session_state["current_ttr_score"],
+                                        st.session_state["change_constant"],
+                                        st.session_state["show_grid"],
+                                        st.session_state["use_darkmode"])
+    for image in images:
+        st.image(image, use_column_width=True)
+
+
+@st.experimental_memo(max_entries=128)
+def render_graphs_after_single(
+        ttr_score_opponent: int,
+        victory: bool,
+        current_ttr_score: int,
+        change_constant: int,
+        show_grid: bool,
+        use_darkmode: bool
+        ) -> tuple[bytes, bytes]:
+    """
+    Render the graphs for the given match as PNG images.
 
-    plot_winning_probability(winning_probability,
-                             st.session_state["ttr_score_opponent_list"]
-                             [match_id]
-                             - st.session_state["current_ttr_score"])
-    plot_ttr_points_gained(new_ttr_score-st.session_state["current_ttr_score"],
-                           st.session_state["ttr_score_opponent_list"]
-                           [match_id]
-                           - st.session_state["current_ttr_score"],
-                           game_won=result)
+    The images are cached by streamlit. They only depend on this match and
+    the display settings, so changing other matches keeps them cached.
+
+    Parameters
+    ----------
+    ttr_score_opponent : int
+        The TTR-score of the opponent in this match.
+    victory : bool
+        Flag, whether the match was won.
+    current_ttr_score : int
+        The current TTR-score of the player.
+    change_constant : int
+        The change constant used for the TTR-score calculation.
+    show_grid : bool
+        Flag, whether grid lines are shown in the graphs.
+    use_darkmode : bool
+        Flag, whether the graphs use a dark background.
+
+    Returns
+    -------
+    tuple[bytes, bytes]
+        The PNG images of the winning probability and of the TTR-points
+        gained.
+    """
+    winning_probability, new_ttr_score = \
+        calculate_match_summary(ttr_score_opponent, victory,
+                                current_ttr_score, change_constant)
+    rating_difference = ttr_score_opponent - current_ttr_score
+
+    style = "dark_background" if use_darkmode else "default"
+    with plt.style.context(style):
+        probability_figure = plot_winning_probability(winning_probability,
+                                                      rating_difference,
+                                                      show_grid=show_grid)
+        points_figure = plot_ttr_points_gained(
+            new_ttr_score-current_ttr_score,
+            rating_difference,
+            game_won=victory,
+            change_constant=change_constant,
+            show_grid=show_grid)
+
+    return figure_to_png(probability_figure), figure_to_png(points_figure)
+
+
+def figure_to_png(
+        fig: plt.figure
+        ) -> bytes:
+    """
+    Convert a plt.figure to a PNG image and close the figure.
+
+    Parameters
+    ----------
+    fig : plt.figure
+        The figure to convert.
+
+    Returns
+    -------
+    bytes
+        The PNG image of the figure.
+    """
+    image = io.BytesIO()
+    fig.savefig(image, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return image.getvalue()
 
 
 def plot_winning_probability(
         winning_probability: int = None,
-        rating_difference: int = None
-        ) -> None:
+        rating_difference: int = None,
+        show_grid: bool = True
+        ) -> plt.figure:
     """
     Show, where the winning probability is located on a global plot.
 
@@ -492,6 +1050,13 @@ def plot_winning_probability(
         The winning probability to highlight in the plot. The default is None.
     rating_difference : int, optional
         The rating difference to highlight in the plot. The default is None.
+    show_grid : bool, optional
+        Flag, whether grid lines are shown. The default is True.
+
+    Returns
+    -------
+    fig : plt.figure
+        The resulting matplotlib.figure.
     """
     rating_differences = define_rating_range(rating_difference)
 
@@ -505,9 +1070,10 @@ def plot_winning_probability(
     # Create plot
     fig = create_plot_figure(rating_differences, winning_probabilites,
                              xlabel="TTR-Punktedifferenz",
-                             ylabel="Gewinnerwartung")
+                             ylabel="Gewinnerwartung",
+                             show_grid=show_grid)
     highlight_point_in_figure(rating_difference, winning_probability)
-    st.pyplot(fig)
+    return fig
 
 
 def define_rating_range(
@@ -539,7 +1105,8 @@ def define_rating_range(
 def create_plot_figure(x_list: list[int],
                        y_list: list[int],
                        xlabel: str,
-                       ylabel: str
+                       ylabel: str,
+                       show_grid: bool = True
                        ) -> plt.figure:
     """
     Create a plt.figure of two lists.
@@ -554,6 +1121,8 @@ def create_plot_figure(x_list: list[int],
         The label that will be displayed on the x-axis.
     ylabel : str
         The label that will be displayed on the y-axis..
+    show_grid : bool, optional
+        Flag, whether grid lines are shown. The default is True.
 
     Returns
     -------
@@ -567,7 +1136,7 @@ def create_plot_figure(x_list: list[int],
     plt.plot(x_list, y_list, zorder=2)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
-    if st.session_state["show_grid"]:
+    if show_grid:
         plt.grid(zorder=1)
 
     return fig
@@ -594,7 +1163,9 @@ def plot_ttr_points_gained(
         ttr_points_gained: int = None,
         rating_difference: int = None,
         game_won: bool = True,
-        ) -> None:
+        change_constant: int = 16,
+        show_grid: bool = True
+        ) -> plt.figure:
     """
     Show where the gained ttr-points are located on a global plot.
 
@@ -608,6 +1179,16 @@ def plot_ttr_points_gained(
         Flag, whether the game was won or lost. This results in the plot
         showing a positive change in TTR-points or a negative change in points.
         The default is True.
+    change_constant : int, optional
+        The change constant used for the TTR-score calculation.
+        The default is 16.
+    show_grid : bool, optional
+        Flag, whether grid lines are shown. The default is True.
+
+    Returns
+    -------
+    fig : plt.figure
+        The resulting matplotlib.figure.
     """
     rating_differences = define_rating_range(rating_difference)
 
@@ -616,16 +1197,16 @@ def plot_ttr_points_gained(
     result = 1 if game_won else 0
     for difference in rating_differences:
         probability = calculate_winning_probability(0, difference)
-        change = round((result-probability)
-                       * st.session_state["change_constant"])
+        change = round((result-probability) * change_constant)
         ttr_changes.append(change)
 
     # Create plot
     fig = create_plot_figure(rating_differences, ttr_changes,
                              xlabel="TTR-Punktedifferenz",
-                             ylabel="Veränderung TTR-Punkte")
+                             ylabel="Veränderung TTR-Punkte",
+                             show_grid=show_grid)
     highlight_point_in_figure(rating_difference, ttr_points_gained)
-    st.pyplot(fig)
+    return fig
 
 
 def section_explanation_tab(
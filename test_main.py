@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the tournament model of the TTR-calculator.
+
+Run with pytest from the repository root.
+"""
+
+from main import Tournament, TournamentHistory
+
+
+def build_tournament(
+        matches: list[tuple[int, bool]]
+        ) -> Tournament:
+    """Build a tournament by adding the given matches one after another."""
+    tournament = Tournament()
+    for ttr_score_opponent, victory in matches:
+        tournament = tournament.add_match(ttr_score_opponent, victory)
+    return tournament
+
+
+def assert_tournament(
+        tournament: Tournament,
+        matches: list[tuple[int, bool]]
+        ) -> None:
+    """Check all derived values of the tournament against its matches."""
+    assert tournament.matches == matches
+    assert len(tournament) == len(matches)
+    assert tournament.match_results == sum(victory for _, victory in matches)
+    assert tournament.ttr_score_opponent_list == \
+        [ttr_score_opponent for ttr_score_opponent, _ in matches]
+    assert tournament.key == tuple(matches)
+
+    rebuilt = build_tournament(matches)
+    assert tournament == rebuilt
+    assert hash(tournament) == hash(rebuilt)
+
+
+def test_empty_tournament():
+    assert_tournament(Tournament(), [])
+
+
+def test_add_match():
+    tournament = Tournament().add_match(1400, True).add_match(1500, False)
+    assert_tournament(tournament, [(1400, True), (1500, False)])
+
+
+def test_add_match_keeps_snapshot():
+    snapshot = build_tournament([(1400, True)])
+    snapshot.add_match(1500, False)
+    assert_tournament(snapshot, [(1400, True)])
+
+
+def test_remove_match_down_to_empty():
+    tournament = build_tournament([(1400, True), (1500, False)])
+    tournament = tournament.remove_match()
+    assert_tournament(tournament, [(1400, True)])
+    tournament = tournament.remove_match()
+    assert_tournament(tournament, [])
+    assert_tournament(tournament.remove_match(), [])
+
+
+def test_replace_match_keeps_order():
+    matches = [(1400, True), (1500, False), (1300, True), (1600, False)]
+    tournament = build_tournament(matches)
+
+    assert_tournament(tournament.replace_match(0, 1700, False),
+                      [(1700, False)] + matches[1:])
+    assert_tournament(tournament.replace_match(2, 1200, False),
+                      matches[:2] + [(1200, False)] + matches[3:])
+    assert_tournament(tournament.replace_match(3, 1800, True),
+                      matches[:3] + [(1800, True)])
+    assert_tournament(tournament, matches)
+
+
+def test_different_tournaments_are_not_equal():
+    tournament = build_tournament([(1400, True), (1500, False)])
+    assert tournament != build_tournament([(1400, True), (1500, True)])
+    assert tournament != build_tournament([(1500, False), (1400, True)])
+    assert tournament != build_tournament([(1400, True)])
+
+
+def test_undo_redo():
+    first = build_tournament([(1400, True)])
+    second = first.add_match(1500, False)
+    third = second.replace_match(0, 1300, False)
+    history = TournamentHistory(first)
+    assert not history.can_undo
+    assert not history.can_redo
+
+    history.commit(second)
+    history.commit(third)
+    assert history.current == third
+
+    history.undo()
+    assert_tournament(history.current, [(1400, True), (1500, False)])
+    history.undo()
+    assert_tournament(history.current, [(1400, True)])
+    assert not history.can_undo
+    history.undo()
+    assert_tournament(history.current, [(1400, True)])
+
+    history.redo()
+    assert_tournament(history.current, [(1400, True), (1500, False)])
+    history.redo()
+    assert_tournament(history.current, [(1300, False), (1500, False)])
+    assert not history.can_redo
+
+
+def test_commit_clears_redo():
+    first = build_tournament([(1400, True)])
+    history = TournamentHistory(first)
+    history.commit(first.add_match(1500, False))
+    history.undo()
+    assert history.can_redo
+
+    history.commit(first.remove_match())
+    assert not history.can_redo
+    assert_tournament(history.current, [])
+    history.undo()
+    assert_tournament(history.current, [(1400, True)])
+
+
+def test_commit_ignores_equal_tournament():
+    tournament = build_tournament([(1400, True)])
+    history = TournamentHistory(tournament)
+    history.commit(build_tournament([(1400, True)]))
+    assert not history.can_undo